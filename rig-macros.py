@@ -35,38 +35,67 @@ import tkinter as tk
 from tkinter import filedialog, scrolledtext, messagebox
 import xmlrpc.client
 import sys
-from functools import partial
+import io
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import subprocess
+import shutil
 import threading
+import asyncio
 import queue
+import collections
+import contextlib
 import serial
 import time
 import configparser
+import dataclasses
+import hashlib
+import fcntl
+import struct
+import signal
 
 import os
 
+# Optional: play TTS audio in-process instead of spawning paplay per press
+try:
+    import sounddevice as sd
+    import soundfile as sf
+except (ImportError, OSError):
+    # OSError: the module is installed but libportaudio/libsndfile is missing
+    sd = None
+    sf = None
+
 VERSION = "1.0.0"
 
-log_path = r"/tmp/rig-macros-error.log"
+# External tools resolved once, so spawns don't search PATH every time
+PAPLAY = shutil.which("paplay") or "/usr/bin/paplay"
+SOX = shutil.which("sox") or "/usr/bin/sox"
+PIPER = shutil.which("piper") or "piper"
+FFMPEG = shutil.which("ffmpeg") or "/usr/bin/ffmpeg"
 
-class Logger:
-    def __init__(self, filename):
-        self.log = open(filename, "w", buffering=1)  # write (truncate) mode, line-buffered
+log_path = r"/tmp/rig-macros-error.log"
 
-    def write(self, message):
-        if message.strip():
-            if not message.endswith("\n"):
-                message += "\n"
-            self.log.write(message)
-            self.log.flush()
+# Point fds 1 and 2 at the log file so Python output and the output of any
+# child process that inherits them land in the same place, line-buffered
+log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+os.dup2(log_fd, 1)
+os.dup2(log_fd, 2)
+os.close(log_fd)
+sys.stdout = os.fdopen(1, "w", buffering=1, closefd=False)
+sys.stderr = os.fdopen(2, "w", buffering=1, closefd=False)
+print("=== Rig Macros Script Started ===", file=sys.stderr)
 
-    def flush(self):
-        self.log.flush()
+# HH:MM:SS timestamp for log lines, formatted at most once per second
+_last_t = 0
+_last_s = ""
 
-sys.stderr = Logger(log_path)
-sys.stdout = Logger(log_path)
-print("=== Rig Macros Script Started ===", file=sys.stderr)
+def _ts():
+    global _last_t, _last_s
+    t = int(time.time())
+    if t != _last_t:
+        _last_t = t
+        _last_s = time.strftime("%H:%M:%S", time.localtime(t))
+    return _last_s
 
 # Load configuration file
 config = configparser.ConfigParser()
@@ -78,14 +107,50 @@ else:
     print(f"Warning: Configuration file not found at {config_file}", file=sys.stderr)
     print("Using default values", file=sys.stderr)
 
+# Settings parsed once at startup; handlers read attributes instead of
+# going back through ConfigParser
+@dataclasses.dataclass(frozen=True)
+class RigConfig:
+    t1_label: str
+    t2_label: str
+    t3_label: str
+    t4_label: str
+    button1_label: str
+    button1_text: str
+    button1_scale: str
+    button2_label: str
+    button2_text: str
+    button2_scale: str
+    button3_label: str
+    button3_text: str
+    button3_scale: str
+    button3_pitch: str
+
+CFG = RigConfig(
+    t1_label=config.get('Voice Keyer Memory', 't1_label', fallback='N9OH'),
+    t2_label=config.get('Voice Keyer Memory', 't2_label', fallback='59 FL'),
+    t3_label=config.get('Voice Keyer Memory', 't3_label', fallback='T3'),
+    t4_label=config.get('Voice Keyer Memory', 't4_label', fallback='T4'),
+    button1_label=config.get('Piper TTS', 'button1_label', fallback='N9OH'),
+    button1_text=config.get('Piper TTS', 'button1_text', fallback=",, November Nine Oscar HOTEL"),
+    button1_scale=config.get('Piper TTS', 'button1_length_scale', fallback="0.72"),
+    button2_label=config.get('Piper TTS', 'button2_label', fallback='TU 59'),
+    button2_text=config.get('Piper TTS', 'button2_text', fallback="Thanks, also FIVE NINE"),
+    button2_scale=config.get('Piper TTS', 'button2_length_scale', fallback="0.72"),
+    button3_label=config.get('Piper TTS', 'button3_label', fallback='73'),
+    button3_text=config.get('Piper TTS', 'button3_text', fallback="Seventy-Three"),
+    button3_scale=config.get('Piper TTS', 'button3_length_scale', fallback="0.55"),
+    button3_pitch=config.get('Piper TTS', 'button3_pitch', fallback='150'),
+)
+
 # Ensure Piper voice model is downloaded at startup
 def ensure_piper_model(debug_queue=None):
     voice_model = "en_US-hfc_male-medium"
     msg = f"Checking for Piper voice model: {voice_model}"
     print(msg, file=sys.stderr)
-    if debug_queue:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        debug_queue.put(f"[{timestamp}] {msg}")
+    if debug_queue is not None:
+        timestamp = _ts()
+        debug_queue.append(f"[{timestamp}] {msg}")
     
     try:
         result = subprocess.run(
@@ -97,108 +162,228 @@ def ensure_piper_model(debug_queue=None):
         if result.returncode == 0:
             msg = f"Piper voice model '{voice_model}' downloaded and ready"
             print(msg, file=sys.stderr)
-            if debug_queue:
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                debug_queue.put(f"[{timestamp}] {msg}")
+            if debug_queue is not None:
+                timestamp = _ts()
+                debug_queue.append(f"[{timestamp}] {msg}")
             return True
         else:
             msg = f"Failed to download Piper voice model: {result.stderr}"
             print(msg, file=sys.stderr)
-            if debug_queue:
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                debug_queue.put(f"[{timestamp}] {msg}")
+            if debug_queue is not None:
+                timestamp = _ts()
+                debug_queue.append(f"[{timestamp}] {msg}")
             return False
     except subprocess.TimeoutExpired:
         msg = f"Piper model download timed out (5 min timeout exceeded)"
         print(msg, file=sys.stderr)
-        if debug_queue:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            debug_queue.put(f"[{timestamp}] {msg}")
+        if debug_queue is not None:
+            timestamp = _ts()
+            debug_queue.append(f"[{timestamp}] {msg}")
         return False
     except Exception as e:
         msg = f"Error checking Piper voice model: {e}"
         print(msg, file=sys.stderr)
-        if debug_queue:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            debug_queue.put(f"[{timestamp}] {msg}")
+        if debug_queue is not None:
+            timestamp = _ts()
+            debug_queue.append(f"[{timestamp}] {msg}")
         return False
 
+# CI-V commands to play the IC-7300 voice memories (decoded once at load)
+CIV_T1 = bytes.fromhex("FEFE94E3280001FD")
+CIV_T2 = bytes.fromhex("FEFE94E3280002FD")
+
+# Linux USB-serial drivers batch I/O on a ~16 ms timer by default; setting
+# ASYNC_LOW_LATENCY in the driver's serial_struct flags turns that off
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+ASYNC_LOW_LATENCY = 0x2000
+
+def set_low_latency(port):
+    buf = bytearray(fcntl.ioctl(port.fileno(), TIOCGSERIAL, bytes(128)))
+    flags, = struct.unpack_from("i", buf, 16)  # serial_struct.flags
+    struct.pack_into("i", buf, 16, flags | ASYNC_LOW_LATENCY)
+    fcntl.ioctl(port.fileno(), TIOCSSERIAL, bytes(buf))
+
 # Open serial port once at startup and keep it open with both RTS and DTR LOW
 serial_port = None
+rts_settle = 0.05  # pause between RTS and the CI-V write
 try:
     serial_port = serial.Serial('/dev/ttyUSB0', 19200, timeout=0.1)
     serial_port.rts = False  # Keep RTS LOW (no PTT)
     serial_port.dtr = False  # Keep DTR LOW (no CW keying)
     print(f"Serial port opened with RTS=LOW, DTR=LOW", file=sys.stderr)
+    try:
+        set_low_latency(serial_port)
+        rts_settle = 0.005
+        print("Serial port set to low-latency mode", file=sys.stderr)
+    except Exception as e:
+        print(f"Warning: Could not enable serial low-latency mode: {e}", file=sys.stderr)
 except Exception as e:
     print(f"Warning: Could not open serial port: {e}", file=sys.stderr)
 
+# Hold RTS high (radio keyed) for the duration of a block; RTS is lowered on
+# every exit path, including exceptions
+@contextlib.contextmanager
+def keyed():
+    serial_port.rts = True
+    try:
+        yield
+    finally:
+        serial_port.rts = False
+
+# XML-RPC transport for FLRig that serializes requests with a lock, because
+# the proxy is shared by the GUI and the voice keyer / TTS threads. Keep-alive
+# needs nothing extra: the stock Transport caches its HTTPConnection and reuses
+# it for every request to the same host.
+class LockedTransport(xmlrpc.client.Transport):
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def request(self, host, handler, request_body, verbose=False):
+        with self._lock:
+            return super().request(host, handler, request_body, verbose)
+
 try:
     # Connect to FLRig
-    flrig = xmlrpc.client.ServerProxy("http://localhost:12345")
+    flrig = xmlrpc.client.ServerProxy("http://localhost:12345", transport=LockedTransport())
 
+    # One Piper process per file, with the length scale on its command line
+    def piper_synthesize(text, filename, length_scale):
+        piper_cmd = [
+            PIPER,
+            "--model", "en_US-hfc_male-medium",
+            "--output_file", filename,
+            "--length-scale", length_scale
+        ]
+        piper_process = subprocess.Popen(
+            piper_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=io.DEFAULT_BUFFER_SIZE
+        )
+        _, piper_error = piper_process.communicate(input=text.encode() + b"\n")
+        return piper_process.returncode == 0, piper_error.decode()
+    
     # Pre-generate TTS audio files at startup (will use debug_queue once GUI is ready)
     def generate_tts_file(text, filename, debug_queue=None, length_scale="0.72"):
         try:
-            piper_cmd = [
-                "piper",
-                "--model", "en_US-hfc_male-medium",
-                "--output_file", filename,
-                "--length-scale", length_scale
-            ]
-            piper_process = subprocess.Popen(
-                piper_cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE
-            )
-            piper_output, piper_error = piper_process.communicate(input=text.encode() + b"\n")
-            if piper_process.returncode == 0 and os.path.exists(filename):
+            # Write to a temporary name and rename when done, so a partial file
+            # is never mistaken for a cached one
+            partial_file = filename + ".part"
+            ok, piper_error = piper_synthesize(text, partial_file, length_scale)
+            if ok and os.path.exists(partial_file):
+                os.replace(partial_file, filename)
                 file_size = os.path.getsize(filename)
                 msg = f"Pre-generated TTS: {filename} ({file_size} bytes)"
                 print(msg, file=sys.stderr)
-                if debug_queue:
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    debug_queue.put(f"[{timestamp}] {msg}")
+                if debug_queue is not None:
+                    timestamp = _ts()
+                    debug_queue.append(f"[{timestamp}] {msg}")
                 return True
             else:
-                msg = f"TTS generation failed for {filename}: {piper_error.decode()}"
+                if os.path.exists(partial_file):
+                    os.remove(partial_file)
+                msg = f"TTS generation failed for {filename}: {piper_error}"
                 print(msg, file=sys.stderr)
-                if debug_queue:
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    debug_queue.put(f"[{timestamp}] {msg}")
+                if debug_queue is not None:
+                    timestamp = _ts()
+                    debug_queue.append(f"[{timestamp}] {msg}")
                 return False
         except Exception as e:
             msg = f"TTS generation error: {e}"
             print(msg, file=sys.stderr)
-            if debug_queue:
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                debug_queue.put(f"[{timestamp}] {msg}")
+            if debug_queue is not None:
+                timestamp = _ts()
+                debug_queue.append(f"[{timestamp}] {msg}")
             return False
 
+    # TTS phrases per button; output files are named by a hash of the text and
+    # length scale so unchanged phrases are reused across launches. The "v2"
+    # tag retires files made by the old persistent Piper, which ignored the
+    # length scale.
+    tts_phrases = {
+        1: (CFG.button1_text, CFG.button1_scale),
+        2: (CFG.button2_text, CFG.button2_scale),
+        3: (CFG.button3_text, CFG.button3_scale),
+    }
+    
+    def tts_file_path(button, text, length_scale):
+        key = hashlib.blake2b(f"v2|{text}|{length_scale}".encode(), digest_size=8).hexdigest()
+        return f"/tmp/tts_{button}_{key}.wav"
+    
+    tts_files = {button: tts_file_path(button, text, scale) for button, (text, scale) in tts_phrases.items()}
+    
+    # Set once pre-generation has finished (successfully or not)
+    tts_ready = threading.Event()
+    
+    # Sox pitch shift (in cents) per button, applied once after generation
+    tts_pitches = {3: CFG.button3_pitch}
+    
+    def pitched_file_path(wav_file, pitch):
+        return f"{os.path.splitext(wav_file)[0]}_pitch{pitch}.wav"
+    
+    def apply_pitch(wav_file, pitch, debug_queue=None):
+        pitched_file = pitched_file_path(wav_file, pitch)
+        if os.path.exists(pitched_file) and os.path.getmtime(pitched_file) >= os.path.getmtime(wav_file):
+            return True
+        partial_file = pitched_file + ".part"
+        try:
+            result = subprocess.run([SOX, wav_file, "-t", "wav", partial_file, "pitch", pitch],
+                                    capture_output=True, text=True)
+            if result.returncode == 0:
+                os.replace(partial_file, pitched_file)
+                msg = f"Applied pitch shift ({pitch} cents) to {pitched_file}"
+            else:
+                if os.path.exists(partial_file):
+                    os.remove(partial_file)
+                msg = f"Sox pitch error: {result.stderr}"
+        except Exception as e:
+            msg = f"Sox error: {e}"
+        print(msg, file=sys.stderr)
+        if debug_queue is not None:
+            timestamp = _ts()
+            debug_queue.append(f"[{timestamp}] {msg}")
+        return os.path.exists(pitched_file)
+    
     # Pre-generate TTS files in background (will be called later with debug_queue)
     def pre_generate_tts(debug_queue=None):
-        msg = "Pre-generating TTS audio files..."
-        print(msg, file=sys.stderr)
-        if debug_queue:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            debug_queue.put(f"[{timestamp}] {msg}")
-        
-        button1_text = config.get('Piper TTS', 'button1_text', fallback=",, November Nine Oscar HOTEL")
-        button1_scale = config.get('Piper TTS', 'button1_length_scale', fallback="0.72")
-        button2_text = config.get('Piper TTS', 'button2_text', fallback="Thanks, also FIVE NINE")
-        button2_scale = config.get('Piper TTS', 'button2_length_scale', fallback="0.72")
-        button3_text = config.get('Piper TTS', 'button3_text', fallback="Seventy-Three")
-        button3_scale = config.get('Piper TTS', 'button3_length_scale', fallback="0.55")
-        
-        generate_tts_file(button1_text, "/tmp/tts_n9oh.wav", debug_queue, button1_scale)
-        generate_tts_file(button2_text, "/tmp/tts_tu59.wav", debug_queue, button2_scale)
-        generate_tts_file(button3_text, "/tmp/tts_73.wav", debug_queue, button3_scale)
-        msg = "TTS pre-generation complete"
-        print(msg, file=sys.stderr)
-        if debug_queue:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            debug_queue.put(f"[{timestamp}] {msg}")
+        try:
+            msg = "Pre-generating TTS audio files..."
+            print(msg, file=sys.stderr)
+            if debug_queue is not None:
+                timestamp = _ts()
+                debug_queue.append(f"[{timestamp}] {msg}")
+            
+            jobs = []
+            for button, (text, scale) in tts_phrases.items():
+                filename = tts_files[button]
+                if os.path.exists(filename):
+                    msg = f"Using cached TTS: {filename}"
+                    print(msg, file=sys.stderr)
+                    if debug_queue is not None:
+                        timestamp = _ts()
+                        debug_queue.append(f"[{timestamp}] {msg}")
+                    continue
+                jobs.append((text, filename, debug_queue, scale))
+            
+            # Each job is its own Piper process, so run them side by side
+            if jobs:
+                with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                    list(executor.map(lambda job: generate_tts_file(*job), jobs))
+            
+            for button, pitch in tts_pitches.items():
+                if pitch and pitch != "0" and os.path.exists(tts_files[button]):
+                    apply_pitch(tts_files[button], pitch, debug_queue)
+            msg = "TTS pre-generation complete"
+            print(msg, file=sys.stderr)
+            if debug_queue is not None:
+                timestamp = _ts()
+                debug_queue.append(f"[{timestamp}] {msg}")
+        finally:
+            # Wake any TTS press that is waiting on the files
+            tts_ready.set()
 
     # GUI setup
     root = tk.Tk()
@@ -209,44 +394,100 @@ try:
     status_label = tk.Label(root, textvariable=status_var, fg="blue", font=("TkDefaultFont", 14))
     status_label.pack(pady=5)
     
+    # Status text is coalesced: callers (from any thread) only store the latest
+    # message, and the Tk loop applies it on the apply_rig_status tick. Worker
+    # threads must never call into Tk themselves. A user-action message is held
+    # for STATUS_HOLD seconds before rig status snapshots may replace it.
+    STATUS_HOLD = 2.0
+    _pending_status = None
+    _status_hold_until = 0.0
+    _status_lock = threading.Lock()
+    
+    def _set_status(msg):
+        global _pending_status, _status_hold_until
+        with _status_lock:
+            _pending_status = msg
+            _status_hold_until = time.monotonic() + STATUS_HOLD
+    
+    def _set_poll_status(msg):
+        global _pending_status
+        with _status_lock:
+            if _pending_status is None and time.monotonic() >= _status_hold_until:
+                _pending_status = msg
+    
+    def _flush_status():
+        global _pending_status
+        with _status_lock:
+            msg, _pending_status = _pending_status, None
+        if msg is not None:
+            status_var.set(msg)
+    
     # VFO B status label (shown when split is enabled)
     status_b_var = tk.StringVar()
     status_b_label = tk.Label(root, textvariable=status_b_var, fg="green", font=("TkDefaultFont", 12))
     # Initially not packed - will be shown when split is enabled
 
-    def poll_rig_status():
+    # Rig status is polled on a background thread so FLRig latency never
+    # stalls the GUI; the main loop only applies the newest snapshot.
+    rig_status_queue = queue.Queue()
+    shutdown = threading.Event()
+
+    def poll_rig_worker():
+        # Dedicated proxy so the poller never shares a connection with GUI calls
+        flrig_poll = xmlrpc.client.ServerProxy("http://localhost:12345", transport=LockedTransport())
+        while not shutdown.is_set():
+            try:
+                # Fetch everything in a single XML-RPC round-trip
+                mc = xmlrpc.client.MultiCall(flrig_poll)
+                mc.rig.get_vfoA()
+                mc.rig.get_mode()
+                mc.rig.get_AB()
+                mc.rig.get_split()
+                mc.rig.get_vfoB()
+                mc.rig.get_modeB()
+                rig_status_queue.put(tuple(mc()))
+            except Exception as e:
+                print(f"Rig status poll error: {e}", file=sys.stderr)
+            shutdown.wait(2)
+
+    def apply_rig_status():
+        snapshot = None
         try:
-            freq_hz = float(flrig.rig.get_vfoA())
-            mode = flrig.rig.get_mode()
-            vfo = flrig.rig.get_AB()
-            split = flrig.rig.get_split()
-            split_txt = "Split ON" if split == 1 else "Split OFF"
-            status_var.set(f"{mode} @ {freq_hz / 1e6:.3f} MHz | VFO {vfo} | {split_txt}")
-            split_indicator.config(bg="yellow" if split == 1 else "gray")
-            
-            # Show VFO B status when split is enabled
-            if split == 1:
-                freq_b_hz = float(flrig.rig.get_vfoB())
-                mode_b = flrig.rig.get_modeB()
-                status_b_var.set(f"{mode_b} @ {freq_b_hz / 1e6:.3f} MHz | VFO B")
-                status_b_label.pack(pady=(0, 5), before=top_frame)
-            else:
-                status_b_label.pack_forget()
+            # Only the most recent snapshot matters
+            while True:
+                snapshot = rig_status_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            if snapshot is not None:
+                freq_a, mode, vfo, split, freq_b, mode_b = snapshot
+                freq_hz = float(freq_a)
+                split_txt = "Split ON" if split == 1 else "Split OFF"
+                _set_poll_status(f"{mode} @ {freq_hz / 1e6:.3f} MHz | VFO {vfo} | {split_txt}")
+                split_indicator.config(bg="yellow" if split == 1 else "gray")
                 
+                # Show VFO B status when split is enabled
+                if split == 1:
+                    freq_b_hz = float(freq_b)
+                    status_b_var.set(f"{mode_b} @ {freq_b_hz / 1e6:.3f} MHz | VFO B")
+                    status_b_label.pack(pady=(0, 5), before=top_frame)
+                else:
+                    status_b_label.pack_forget()
         except Exception as e:
-            print(f"Rig status poll error: {e}\n", file=sys.stderr)
+            print(f"Rig status update error: {e}", file=sys.stderr)
         finally:
-            root.after(2000, poll_rig_status)
+            _flush_status()
+            root.after(100, apply_rig_status)
 
     def toggle_split():
         try:
             current_split = flrig.rig.get_split()
             new_split = 0 if current_split == 1 else 1
             flrig.rig.set_split(new_split)
-            status_var.set(f"Split mode: {'ON' if new_split == 1 else 'OFF'}")
+            _set_status(f"Split mode: {'ON' if new_split == 1 else 'OFF'}")
             split_indicator.config(bg="yellow" if new_split == 1 else "gray")
         except Exception as e:
-            status_var.set(f"Error: {e}")
+            _set_status(f"Error: {e}")
             print(f"Split toggle error: {e}", file=sys.stderr)
 
 
@@ -255,9 +496,9 @@ try:
             current_vfo = flrig.rig.get_AB()
             new_vfo = "B" if current_vfo == "A" else "A"
             flrig.rig.set_AB(new_vfo)
-            status_var.set(f"Switched to VFO {new_vfo}")
+            _set_status(f"Switched to VFO {new_vfo}")
         except Exception as e:
-            status_var.set(f"Error: {e}")
+            _set_status(f"Error: {e}")
             print(f"VFO toggle error: {e}", file=sys.stderr)
 
 
@@ -265,19 +506,25 @@ try:
     def run_vfo_copy():
         try:
             flrig.rig.vfoA2B()
-            status_var.set("VFO A → B copied")
+            _set_status("VFO A → B copied")
         except Exception as e:
-            status_var.set(f"Error: {e}")
+            _set_status(f"Error: {e}")
             print(f"VFO copy error: {e}", file=sys.stderr)
 
     # Function to set frequency and mode
+    # Bumped on every band/mode click; a deferred TTS mode restore scheduled
+    # before the click is stale and must not override the user's choice
+    mode_epoch = 0
+    
     def set_freq_and_mode(freq_hz, mode):
+        global mode_epoch
+        mode_epoch += 1
         try:
             flrig.main.set_frequency(freq_hz)
             flrig.rig.set_mode(mode)
-            status_var.set(f"{mode} @ {freq_hz / 1e6:.3f} MHz")
+            _set_status(f"{mode} @ {freq_hz / 1e6:.3f} MHz")
         except Exception as e:
-            status_var.set(f"Error: {e}")
+            _set_status(f"Error: {e}")
             print(f"Freq/mode error ({freq_hz}, {mode}): {e}", file=sys.stderr)
 
     # Button frame for top row
@@ -299,49 +546,43 @@ try:
     cw_frame = tk.LabelFrame(root, text="CW", padx=10, pady=10, bd=2, relief=tk.GROOVE)
     cw_frame.pack(padx=10, pady=5)
 
-    cw_bands = {
-        "10m": 28000000.0,
-        "12m": 24900000.0,
-        "15m": 21000000.0,
-        "20m": 14000000.0,
-        "40m":  7000000.0
-    }
-
-    for label, freq in cw_bands.items():
-        btn = tk.Button(cw_frame, text=label, width=6,
-                        command=partial(set_freq_and_mode, freq, "CW"))
-        btn.pack(side=tk.LEFT, padx=5)
-
     # SSB Band Frame
     ssb_frame = tk.LabelFrame(root, text="SSB", padx=10, pady=10, bd=2, relief=tk.GROOVE)
     ssb_frame.pack(padx=10, pady=5)
 
-    ssb_bands = {
-        "10m": (28300000.0, "USB"),
-        "12m": (24952000.0, "USB"),
-        "15m": (21200000.0, "USB"),
-        "20m": (14150000.0, "USB"),
-        "40m": (7125000.0, "LSB")
-    }
+    # (frame, label, frequency in Hz, mode) for every band button
+    BANDS = (
+        ("CW", "10m", 28000000.0, "CW"),
+        ("CW", "12m", 24900000.0, "CW"),
+        ("CW", "15m", 21000000.0, "CW"),
+        ("CW", "20m", 14000000.0, "CW"),
+        ("CW", "40m",  7000000.0, "CW"),
+        ("SSB", "10m", 28300000.0, "USB"),
+        ("SSB", "12m", 24952000.0, "USB"),
+        ("SSB", "15m", 21200000.0, "USB"),
+        ("SSB", "20m", 14150000.0, "USB"),
+        ("SSB", "40m",  7125000.0, "LSB"),
+    )
+    band_frames = {"CW": cw_frame, "SSB": ssb_frame}
 
-    for label, (freq, mode) in ssb_bands.items():
-        btn = tk.Button(ssb_frame, text=label, width=6,
-                        command=partial(set_freq_and_mode, freq, mode))
+    for frame_name, label, freq, mode in BANDS:
+        btn = tk.Button(band_frames[frame_name], text=label, width=6,
+                        command=lambda f=freq, m=mode: set_freq_and_mode(f, m))
         btn.pack(side=tk.LEFT, padx=5)
 
     # Recording state
     recording_process = None
     current_recording_file = None
     recording_was_saved = False  # Track if current recording has been saved
-    debug_queue = queue.Queue()
+    debug_queue = collections.deque(maxlen=2000)  # bounded; append/popleft are thread-safe
     
     # Ensure Piper voice model is downloaded (with debug queue available now)
     ensure_piper_model(debug_queue)
     
     # Function to add debug output
     def add_debug(message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        debug_queue.put(f"[{timestamp}] {message}")
+        timestamp = _ts()
+        debug_queue.append(f"[{timestamp}] {message}")
     
      
     # PTT Button (momentary switch - acts like a footswitch)
@@ -355,7 +596,7 @@ try:
         ppt_active = True
         try:
             if not serial_port or not serial_port.is_open:
-                status_var.set("PTT error: Serial port not available")
+                _set_status("PTT error: Serial port not available")
                 add_debug("PTT press error: Serial port not available")
                 ppt_active = False
                 return
@@ -363,10 +604,10 @@ try:
             serial_port.rts = True
             ppt_label.config(bg="red", fg="white", activebackground="darkred", activeforeground="white")
             ppt_label.update()  # Force immediate visual update
-            status_var.set("PTT ON")
+            _set_status("PTT ON")
             add_debug("PTT engaged - RTS raised, radio keyed")
         except Exception as e:
-            status_var.set(f"PTT error: {e}")
+            _set_status(f"PTT error: {e}")
             add_debug(f"PTT press error: {e}")
             print(f"PTT press error: {e}", file=sys.stderr)
             ppt_active = False
@@ -381,10 +622,10 @@ try:
                 serial_port.rts = False
             ppt_label.config(bg=ppt_default_bg, fg=ppt_default_fg, activebackground=ppt_default_bg, activeforeground=ppt_default_fg)
             ppt_label.update()  # Force immediate visual update
-            status_var.set("PTT OFF")
+            _set_status("PTT OFF")
             add_debug("PTT released - RTS lowered, radio unkeyed")
         except Exception as e:
-            status_var.set(f"PTT error: {e}")
+            _set_status(f"PTT error: {e}")
             add_debug(f"PTT release error: {e}")
             print(f"PTT release error: {e}", file=sys.stderr)
     
@@ -401,15 +642,32 @@ try:
     ppt_label.bind("<ButtonRelease-1>", ppt_release)
     ppt_label.bind("<Leave>", ppt_release)
 
+    # Debug text widget is trimmed back to DEBUG_KEEP_LINES once it passes DEBUG_MAX_LINES
+    DEBUG_MAX_LINES = 2000
+    DEBUG_KEEP_LINES = 1500
+    
     # Function to process debug queue and update text widget
     def process_debug_queue():
+        if not debug_visible:
+            # Nothing to draw; the bounded deque keeps the most recent lines
+            # so they appear when the panel is opened
+            root.after(100, process_debug_queue)
+            return
+        batch = []
         try:
             while True:
-                message = debug_queue.get_nowait()
-                debug_text.insert(tk.END, message + "\n")
-                debug_text.see(tk.END)
-        except queue.Empty:
+                batch.append(debug_queue.popleft())
+        except IndexError:
             pass
+        try:
+            if batch:
+                # One insert and one scroll per tick, however many messages arrived
+                debug_text.insert(tk.END, "\n".join(batch) + "\n")
+                # Keep the widget bounded so inserts don't slow down over a long session
+                num_lines = int(debug_text.index("end-1c").split(".")[0])
+                if num_lines > DEBUG_MAX_LINES:
+                    debug_text.delete("1.0", f"{num_lines - DEBUG_KEEP_LINES}.0")
+                debug_text.see(tk.END)
         finally:
             root.after(100, process_debug_queue)
     
@@ -417,15 +675,152 @@ try:
     tts_gen_thread = threading.Thread(target=pre_generate_tts, args=(debug_queue,), daemon=True)
     tts_gen_thread.start()
     
-    # Function to read subprocess output in a thread
-    def read_subprocess_output(process, stream_name):
+    # One asyncio loop on a background thread services the recorder's pipes,
+    # instead of a blocking reader thread per pipe. The Tk thread blocks on this
+    # loop in run_async, so nothing running on it (or on its executor) may call
+    # into Tk; report through add_debug and _set_status only.
+    async_loop = asyncio.new_event_loop()
+    
+    def run_async_loop():
+        async_loop.run_forever()
+        async_loop.close()
+    
+    threading.Thread(target=run_async_loop, daemon=True).start()
+    
+    def run_async(coro, timeout=5):
+        return asyncio.run_coroutine_threadsafe(coro, async_loop).result(timeout)
+    
+    async def cancel_async_tasks():
+        # Cancel long-lived tasks (TTS worker, pipe readers) so the loop can be
+        # stopped and closed without "Task was destroyed but it is pending!"
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def stop_process(process, timeout=2):
+        # Returns True if the process exited on terminate, False if it was killed
+        try:
+            process.terminate()
+        except ProcessLookupError:
+            pass
         try:
-            for line in iter(process.stderr.readline, b''):
-                if line:
-                    add_debug(f"{stream_name}: {line.decode('utf-8', errors='replace').rstrip()}")
+            await asyncio.wait_for(process.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return False
+    
+    def stop_process_blocking(process, timeout=5):
+        # For the Tk thread: never wait on the loop indefinitely. If the loop is
+        # stalled, kill the process directly and carry on.
+        try:
+            return run_async(stop_process(process), timeout=timeout)
+        except FutureTimeoutError:
+            add_debug(f"Timed out stopping process {process.pid}, killing it")
+            try:
+                os.kill(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            return False
+    
+    # Function to read subprocess output
+    async def read_subprocess_output(stream, stream_name):
+        # Read stderr in large chunks and split into lines ourselves, rather than
+        # paying a read per line during ffmpeg's startup burst
+        pending = b""
+        try:
+            while True:
+                chunk = await stream.read(4096)
+                if not chunk:
+                    break
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    if line.strip():
+                        add_debug(f"{stream_name}: {line.decode('utf-8', errors='replace').rstrip()}")
+            if pending.strip():
+                add_debug(f"{stream_name}: {pending.decode('utf-8', errors='replace').rstrip()}")
         except Exception as e:
             add_debug(f"Error reading {stream_name}: {e}")
     
+    # Live monitoring: while recording, ffmpeg also writes raw PCM to stdout.
+    # The forwarder always drains it and hands it to paplay when monitoring is on.
+    MONITOR_RATE = 48000
+    MONITOR_DRAIN_TIMEOUT = 0.5
+    monitor_process = None
+    
+    def drop_live_monitor(monitor):
+        # Runs on the async loop when the monitor paplay falls behind
+        global monitor_process
+        if monitor_process is monitor:
+            monitor_process = None
+        add_debug("Live monitor fell behind, stopping it so recording isn't held up")
+        _set_status("Live monitor stopped (playback stalled)")
+        asyncio.ensure_future(close_monitor(monitor))
+    
+    async def forward_monitor_audio(stream):
+        try:
+            while True:
+                chunk = await stream.read(65536)
+                if not chunk:
+                    break
+                monitor = monitor_process
+                if monitor is not None:
+                    try:
+                        monitor.stdin.write(chunk)
+                        # ffmpeg blocks on a full stdout pipe, so a stalled paplay
+                        # must never hold up this loop; give up on the monitor instead
+                        await asyncio.wait_for(monitor.stdin.drain(), MONITOR_DRAIN_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        drop_live_monitor(monitor)
+                    except (OSError, RuntimeError):
+                        pass
+        except Exception as e:
+            add_debug(f"Monitor stream error: {e}")
+    
+    async def start_recorder(cmd):
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        asyncio.ensure_future(read_subprocess_output(process.stderr, "ffmpeg"))
+        asyncio.ensure_future(forward_monitor_audio(process.stdout))
+        return process
+    
+    async def spawn_monitor():
+        return await asyncio.create_subprocess_exec(
+            PAPLAY, "--raw", "--format=s16le", f"--rate={MONITOR_RATE}", "--channels=2",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            close_fds=False
+        )
+    
+    async def close_monitor(monitor):
+        monitor.stdin.close()
+        await stop_process(monitor)
+    
+    def start_live_monitor():
+        global monitor_process
+        monitor_process = run_async(spawn_monitor(), timeout=5)
+        add_debug("Live monitor started")
+    
+    def stop_live_monitor():
+        global monitor_process
+        if monitor_process is None:
+            return
+        monitor, monitor_process = monitor_process, None
+        try:
+            run_async(close_monitor(monitor), timeout=5)
+        except Exception as e:
+            print(f"Live monitor stop error: {e}", file=sys.stderr)
+        add_debug("Live monitor stopped")
+    
     # Function to toggle recording
     def toggle_recording():
         global recording_process, current_recording_file, recording_was_saved
@@ -438,39 +833,42 @@ try:
                 recording_was_saved = False  # Reset saved flag for new recording
                 
                 cmd = [
-                    "ffmpeg", "-y",
+                    FFMPEG, "-y",
                     "-f", "pulse", "-i", "alsa_input.usb-Burr-Brown_from_TI_USB_Audio_CODEC-00.analog-stereo",
                     "-f", "pulse", "-i", "alsa_input.usb-SHENZHEN_Fullhan_HD_4MP_WEBCAM_20200506-02.mono-fallback",
-                    "-filter_complex", "[0:a][1:a]amerge=inputs=2[aout]",
-                    "-map", "[aout]", "-ac", "2", output_file
+                    # amix scales each input by 1/2; volume=2 restores the original levels
+                    # (normalize=0 would do the same but needs ffmpeg 4.4+)
+                    "-filter_complex", "[0:a][1:a]amix=inputs=2:duration=longest,volume=2,asplit=2[aout][amon]",
+                    "-map", "[aout]", "-ac", "2",
+                    "-c:a", "libmp3lame", "-q:a", "6",
+                    output_file,
+                    # Second copy as raw PCM on stdout for live monitoring
+                    "-map", "[amon]", "-ac", "2", "-ar", str(MONITOR_RATE), "-f", "s16le", "pipe:1"
                 ]
                 
-                recording_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL)
+                # ffmpeg's stderr and monitor stream are serviced on the async loop
+                recording_process = run_async(start_recorder(cmd), timeout=5)
                 add_debug(f"Recording started: {output_file}")
                 add_debug(f"FFmpeg command: {' '.join(cmd)}")
                 
-                # Start thread to read ffmpeg output
-                threading.Thread(target=read_subprocess_output, args=(recording_process, "ffmpeg"), daemon=True).start()
-                
-                status_var.set(f"Recording started: {output_file}")
+                _set_status(f"Recording started: {output_file}")
                 btn_rec.config(bg="red", fg="white")
             else:
                 # Stop recording
                 add_debug("Stopping recording...")
-                recording_process.terminate()
-                try:
-                    recording_process.wait(timeout=2)
+                stop_live_monitor()
+                if stop_process_blocking(recording_process):
                     add_debug("Recording stopped successfully")
-                except subprocess.TimeoutExpired:
-                    recording_process.kill()
+                else:
                     add_debug("Recording killed (timeout)")
                 recording_process = None
                 filename = os.path.basename(current_recording_file) if current_recording_file else "recording"
-                status_var.set(f"Recording stopped: {filename}")
+                _set_status(f"Recording stopped: {filename}")
                 btn_rec.config(bg=default_btn_bg, fg=default_btn_fg)
         except Exception as e:
-            status_var.set(f"Error: {e}")
+            _set_status(f"Error: {e}")
             print(f"Recording error: {e}", file=sys.stderr)
+            stop_live_monitor()
             recording_process = None
             btn_rec.config(bg=default_btn_bg, fg=default_btn_fg)
     
@@ -480,7 +878,7 @@ try:
         try:
             # Check if file exists
             if not current_recording_file or not os.path.exists(current_recording_file):
-                status_var.set("No recording to delete")
+                _set_status("No recording to delete")
                 return
             
             # If recording was saved, ask for confirmation
@@ -492,29 +890,26 @@ try:
                     icon='warning'
                 )
                 if not result:
-                    status_var.set("Delete cancelled")
+                    _set_status("Delete cancelled")
                     return
             
             # Stop recording if active
+            stop_live_monitor()
             if recording_process is not None:
-                recording_process.terminate()
-                try:
-                    recording_process.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    recording_process.kill()
+                stop_process_blocking(recording_process)
                 recording_process = None
             
             # Delete the file
             os.remove(current_recording_file)
             add_debug(f"Deleted: {current_recording_file}")
-            status_var.set(f"Deleted: {os.path.basename(current_recording_file)}")
+            _set_status(f"Deleted: {os.path.basename(current_recording_file)}")
             current_recording_file = None
             recording_was_saved = False
             
             # Always reset button when deleting
             btn_rec.config(bg=default_btn_bg, fg=default_btn_fg)
         except Exception as e:
-            status_var.set(f"Delete error: {e}")
+            _set_status(f"Delete error: {e}")
             print(f"Delete error: {e}", file=sys.stderr)
             # Reset button even on error
             btn_rec.config(bg=default_btn_bg, fg=default_btn_fg)
@@ -523,14 +918,22 @@ try:
     # Function to play the last recording
     def play_recording():
         try:
-            if current_recording_file and os.path.exists(current_recording_file):
+            if recording_process is not None:
+                # Still recording: toggle live monitoring of the stream instead
+                if monitor_process is None:
+                    start_live_monitor()
+                    _set_status("Monitoring live recording")
+                else:
+                    stop_live_monitor()
+                    _set_status("Live monitor off")
+            elif current_recording_file and os.path.exists(current_recording_file):
                 subprocess.Popen(["vlc", current_recording_file], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 add_debug(f"Playing: {current_recording_file}")
-                status_var.set(f"Playing: {os.path.basename(current_recording_file)}")
+                _set_status(f"Playing: {os.path.basename(current_recording_file)}")
             else:
-                status_var.set("No recording to play")
+                _set_status("No recording to play")
         except Exception as e:
-            status_var.set(f"Play error: {e}")
+            _set_status(f"Play error: {e}")
             print(f"Play error: {e}", file=sys.stderr)
     
     # Function to save the recording to a new location
@@ -559,26 +962,31 @@ try:
                     if save_dir and not os.path.exists(save_dir):
                         os.makedirs(save_dir, exist_ok=True)
                     
-                    # Use mv command to move the file
-                    result = subprocess.run(["mv", current_recording_file, save_path], 
-                                          capture_output=True, text=True)
-                    if result.returncode == 0:
+                    # Rename in place; fall back to copy+delete across filesystems
+                    try:
+                        try:
+                            os.replace(current_recording_file, save_path)
+                        except OSError:
+                            shutil.move(current_recording_file, save_path)
+                    except OSError as e:
+                        _set_status(f"Save failed: {e}")
+                        print(f"Save error: {e}", file=sys.stderr)
+                    else:
                         add_debug(f"Saved recording to: {save_path}")
-                        status_var.set(f"Saved: {os.path.basename(save_path)}")
+                        _set_status(f"Saved: {os.path.basename(save_path)}")
                         current_recording_file = save_path
                         recording_was_saved = True  # Mark as saved
-                    else:
-                        status_var.set(f"Save failed: {result.stderr}")
-                        print(f"Save error: {result.stderr}", file=sys.stderr)
             else:
-                status_var.set("No recording to save")
+                _set_status("No recording to save")
         except Exception as e:
-            status_var.set(f"Save error: {e}")
+            _set_status(f"Save error: {e}")
             print(f"Save error: {e}", file=sys.stderr)
 
     # Function to handle window close
     def on_closing():
         global recording_process, serial_port
+        shutdown.set()
+        stop_live_monitor()
         # Close serial port properly
         if serial_port and serial_port.is_open:
             try:
@@ -589,11 +997,27 @@ try:
             except:
                 pass
         if recording_process is not None:
-            recording_process.terminate()
             try:
-                recording_process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                recording_process.kill()
+                stop_process_blocking(recording_process)
+            except Exception as e:
+                print(f"Recording stop error: {e}", file=sys.stderr)
+        # Don't leave the rig in DATA mode if we close during a pending restore
+        if tts_original_mode is not None:
+            try:
+                if tts_restore_epoch == mode_epoch:
+                    flrig.rig.set_mode(tts_original_mode.replace("-D", ""))
+            except Exception as e:
+                print(f"Mode restore error: {e}", file=sys.stderr)
+        if audio_stream is not None:
+            try:
+                audio_stream.close()
+            except Exception:
+                pass
+        try:
+            run_async(cancel_async_tasks(), timeout=2)
+        except Exception as e:
+            print(f"Async shutdown error: {e}", file=sys.stderr)
+        async_loop.call_soon_threadsafe(async_loop.stop)
         root.destroy()
     
     # Recording Frame
@@ -627,126 +1051,80 @@ try:
     lbl_memories = tk.Label(voice_row1, text="Memories:", font=("Arial", 9, "bold"), width=10, anchor=tk.CENTER)
     lbl_memories.pack(side=tk.LEFT, padx=5)
     
-    def play_voice_memory_t1():
-        try:
-            if not serial_port or not serial_port.is_open:
-                status_var.set("Serial port not available")
-                add_debug("Serial port error")
-                return
-            
-            ptt_status = flrig.rig.get_ptt()
-            if ptt_status == 1:
-                status_var.set("Already transmitting")
-                add_debug("Voice keyer blocked: already transmitting")
-                return
-            
-            # Raise RTS to key the radio
+    def make_voice_memory(label, civ_cmd):
+        # Serial and XML-RPC work runs off the Tk thread; status updates go
+        # through _set_status, which flushes on the Tk loop
+        def run():
             try:
-                serial_port.rts = True
-                add_debug("RTS raised for T1")
-                time.sleep(0.05)
+                if not serial_port or not serial_port.is_open:
+                    _set_status("Serial port not available")
+                    add_debug("Serial port error")
+                    return
                 
-                # Send CI-V command to play T1 memory
-                cmd = bytes.fromhex("FEFE94E3280001FD")
-                serial_port.write(cmd)
-                add_debug("T1 CI-V command sent")
+                ptt_status = flrig.rig.get_ptt()
+                if ptt_status == 1:
+                    _set_status("Already transmitting")
+                    add_debug("Voice keyer blocked: already transmitting")
+                    return
                 
-                time.sleep(0.05)
-                serial_port.rts = False
-                add_debug("RTS lowered after command")
-            except Exception as e:
-                add_debug(f"Serial error: {e}")
-                try:
-                    serial_port.rts = False
-                except:
-                    pass
-                return
-            
-            status_var.set("Playing T1")
-            add_debug("T1 playing")
-            
-            # Monitor power meter and stop when done
-            def wait_and_stop():
+                # Key the radio while the CI-V command is sent
                 try:
-                    pwrmeter = float(flrig.rig.get_pwrmeter())
-                    if pwrmeter == 0:
-                        status_var.set("T1 finished")
-                        add_debug("T1 finished")
-                    else:
-                        root.after(100, wait_and_stop)
+                    with keyed():
+                        add_debug(f"RTS raised for {label}")
+                        time.sleep(rts_settle)
+                        
+                        # Send CI-V command to play the voice memory
+                        serial_port.write(civ_cmd)
+                        add_debug(f"{label} CI-V command sent")
+                        
+                        time.sleep(rts_settle)
+                    add_debug("RTS lowered after command")
                 except Exception as e:
-                    add_debug(f"Monitor error: {e}")
-            
-            root.after(300, wait_and_stop)
-        except Exception as e:
-            status_var.set(f"Error: {e}")
-            add_debug(f"Voice keyer error: {e}")
-    
-    btn_n9oh = tk.Button(voice_row1, text=config.get('Voice Keyer Memory', 't1_label', fallback='N9OH'), width=6, command=play_voice_memory_t1)
-    btn_n9oh.pack(side=tk.LEFT, padx=5)
-    
-    def play_voice_memory_t2():
-        try:
-            if not serial_port or not serial_port.is_open:
-                status_var.set("Serial port not available")
-                add_debug("Serial port error")
-                return
-            
-            ptt_status = flrig.rig.get_ptt()
-            if ptt_status == 1:
-                status_var.set("Already transmitting")
-                add_debug("Voice keyer blocked: already transmitting")
-                return
-            
-            # Raise RTS to key the radio
-            try:
-                serial_port.rts = True
-                add_debug("RTS raised for T2")
-                time.sleep(0.05)
+                    add_debug(f"Serial error: {e}")
+                    return
                 
-                # Send CI-V command to play T2 memory
-                cmd = bytes.fromhex("FEFE94E3280002FD")
-                serial_port.write(cmd)
-                add_debug("T2 CI-V command sent")
+                _set_status(f"Playing {label}")
+                add_debug(f"{label} playing")
                 
-                time.sleep(0.05)
-                serial_port.rts = False
-                add_debug("RTS lowered after command")
-            except Exception as e:
-                add_debug(f"Serial error: {e}")
+                # Monitor power meter and PTT from this thread, backing off
+                # 100 -> 500 ms between polls
+                time.sleep(0.3)
+                delay = 0.1
                 try:
-                    serial_port.rts = False
-                except:
-                    pass
-                return
-            
-            status_var.set("Playing T2")
-            add_debug("T2 playing")
-            
-            # Monitor power meter and stop when done
-            def wait_and_stop():
-                try:
-                    pwrmeter = float(flrig.rig.get_pwrmeter())
-                    if pwrmeter == 0:
-                        status_var.set("T2 finished")
-                        add_debug("T2 finished")
-                    else:
-                        root.after(100, wait_and_stop)
+                    while True:
+                        mc = xmlrpc.client.MultiCall(flrig)
+                        mc.rig.get_pwrmeter()
+                        mc.rig.get_ptt()
+                        pwrmeter, ptt = list(mc())
+                        if float(pwrmeter) == 0 and int(ptt) == 0:
+                            break
+                        time.sleep(delay)
+                        delay = min(delay * 2, 0.5)
+                    _set_status(f"{label} finished")
+                    add_debug(f"{label} finished")
                 except Exception as e:
                     add_debug(f"Monitor error: {e}")
-            
-            root.after(300, wait_and_stop)
-        except Exception as e:
-            status_var.set(f"Error: {e}")
-            add_debug(f"Voice keyer error: {e}")
+            except Exception as e:
+                _set_status(f"Error: {e}")
+                add_debug(f"Voice keyer error: {e}")
+        
+        def handler():
+            threading.Thread(target=run, daemon=True).start()
+        return handler
     
-    btn_t2 = tk.Button(voice_row1, text=config.get('Voice Keyer Memory', 't2_label', fallback='59 FL'), width=6, command=play_voice_memory_t2)
+    play_voice_memory_t1 = make_voice_memory("T1", CIV_T1)
+    play_voice_memory_t2 = make_voice_memory("T2", CIV_T2)
+    
+    btn_n9oh = tk.Button(voice_row1, text=CFG.t1_label, width=6, command=play_voice_memory_t1)
+    btn_n9oh.pack(side=tk.LEFT, padx=5)
+    
+    btn_t2 = tk.Button(voice_row1, text=CFG.t2_label, width=6, command=play_voice_memory_t2)
     btn_t2.pack(side=tk.LEFT, padx=5)
     
-    btn_t3 = tk.Button(voice_row1, text=config.get('Voice Keyer Memory', 't3_label', fallback='T3'), width=6, state=tk.DISABLED)
+    btn_t3 = tk.Button(voice_row1, text=CFG.t3_label, width=6, state=tk.DISABLED)
     btn_t3.pack(side=tk.LEFT, padx=5)
     
-    btn_t4 = tk.Button(voice_row1, text=config.get('Voice Keyer Memory', 't4_label', fallback='T4'), width=6, state=tk.DISABLED)
+    btn_t4 = tk.Button(voice_row1, text=CFG.t4_label, width=6, state=tk.DISABLED)
     btn_t4.pack(side=tk.LEFT, padx=5)
 
     # Second row - TTS Buttons
@@ -756,324 +1134,252 @@ try:
     lbl_tts = tk.Label(voice_row2, text="Piper TTS:", font=("Arial", 9, "bold"), width=10, anchor=tk.CENTER)
     lbl_tts.pack(side=tk.LEFT, padx=5)
     
-    def play_tts_n9oh():
-        def tts_thread():
+    # With sounddevice available, TTS audio is decoded once and written to a
+    # single output stream kept open for the whole session; otherwise each
+    # press spawns paplay
+    audio_cache = {}
+    audio_stream = None
+    audio_lock = threading.Lock()
+    
+    def load_audio(path):
+        mtime = os.path.getmtime(path)
+        entry = audio_cache.get(path)
+        if entry is None or entry[0] != mtime:
+            data, samplerate = sf.read(path, dtype="float32", always_2d=True)
+            entry = audio_cache[path] = (mtime, data, samplerate)
+        return entry[1], entry[2]
+    
+    def open_audio_stream(samplerate, channels):
+        global audio_stream
+        if audio_stream is None or audio_stream.samplerate != samplerate or audio_stream.channels != channels:
+            if audio_stream is not None:
+                audio_stream.close()
+            audio_stream = sd.OutputStream(samplerate=samplerate, channels=channels, dtype="float32",
+                                           blocksize=2048, latency="high")
+        return audio_stream
+    
+    def write_audio(path):
+        global audio_stream
+        with audio_lock:
+            data, samplerate = load_audio(path)
+            stream = open_audio_stream(samplerate, data.shape[1])
             try:
-                if not serial_port or not serial_port.is_open:
-                    add_debug("Serial port not available")
-                    status_var.set("Serial port error")
-                    return
-                
-                wav_file = "/tmp/tts_n9oh.wav"
-                
-                # Check if pre-generated file exists
-                if not os.path.exists(wav_file):
-                    add_debug("TTS file not ready yet, waiting...")
-                    status_var.set("Waiting for TTS generation...")
-                    # Wait up to 5 seconds for file
-                    for i in range(50):
-                        if os.path.exists(wav_file):
-                            break
-                        time.sleep(0.1)
-                    if not os.path.exists(wav_file):
-                        add_debug("ERROR: TTS file still not available")
-                        status_var.set("TTS generation failed")
-                        return
-                
-                add_debug(f"Using pre-generated TTS audio: {wav_file}")
-                
-                # Save current mode and switch to DATA version of current mode
-                original_mode = None
-                try:
-                    original_mode = flrig.rig.get_mode()
-                    add_debug(f"Current mode: {original_mode}")
-                    # Switch to DATA version of current mode (USB->USB-D, LSB->LSB-D, etc)
-                    if "-D" not in original_mode:
-                        data_mode = original_mode + "-D"
-                    else:
-                        data_mode = original_mode
-                    flrig.rig.set_mode(data_mode)
-                    add_debug(f"Switched to {data_mode} mode")
-                    time.sleep(0.2)
-                except Exception as e:
-                    add_debug(f"Mode switch error: {e}")
-                
-                add_debug("Raising RTS to key radio...")
-                
-                # Raise RTS to key the radio
-                try:
-                    serial_port.rts = True
-                    add_debug("RTS raised for TTS playback")
-                except Exception as e:
-                    add_debug(f"RTS error: {e}")
-                    status_var.set("RTS control failed")
-                    return
-                
-                # Play the generated audio with paplay
-                add_debug(f"Playing: paplay {wav_file}")
-                paplay_process = subprocess.Popen(
-                    ["paplay", wav_file],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-                
-                paplay_output, paplay_error = paplay_process.communicate()
-                if paplay_process.returncode != 0:
-                    add_debug(f"paplay error: {paplay_error.decode()}")
-                
-                add_debug("TTS playback finished, lowering RTS...")
-                
-                # Lower RTS after audio finishes
+                if not stream.active:
+                    stream.start()
+                for i in range(0, len(data), 4096):
+                    stream.write(data[i:i + 4096])
+                # stop() returns once the buffered tail has played, so RTS isn't dropped early
+                stream.stop()
+            except Exception:
+                # Drop the broken stream so the next press opens a fresh one
+                audio_stream = None
                 try:
-                    serial_port.rts = False
-                    add_debug("RTS lowered after TTS playback")
-                except Exception as e:
-                    add_debug(f"RTS lower error: {e}")
-                
-                # Switch back to original mode (non-DATA version)
-                if original_mode:
-                    try:
-                        restore_mode = original_mode.replace("-D", "")
-                        flrig.rig.set_mode(restore_mode)
-                        add_debug(f"Restored to {restore_mode} mode after TTS playback")
-                        time.sleep(0.1)
-                    except Exception as e:
-                        add_debug(f"Mode restore error: {e}")
-                
-                status_var.set("TTS N9OH finished")
-            except Exception as e:
-                add_debug(f"TTS error: {e}")
-                status_var.set(f"TTS error: {e}")
-                try:
-                    serial_port.rts = False
-                except:
+                    stream.close()
+                except Exception:
                     pass
-        
-        status_var.set("Playing TTS N9OH...")
-        tts_thread_obj = threading.Thread(target=tts_thread, daemon=True)
-        tts_thread_obj.start()
+                raise
     
-    btn_tts_n9oh = tk.Button(voice_row2, text=config.get('Piper TTS', 'button1_label', fallback='N9OH'), width=6, command=play_tts_n9oh)
-    btn_tts_n9oh.pack(side=tk.LEFT, padx=5)
+    def preload_tts_audio():
+        # Decode every TTS file and open the output stream as soon as
+        # pre-generation is done, so the first press doesn't pay for either
+        tts_ready.wait()
+        try:
+            with audio_lock:
+                for button, wav_file in tts_files.items():
+                    pitch = tts_pitches.get(button)
+                    for path in (wav_file, pitched_file_path(wav_file, pitch) if pitch else None):
+                        if path and os.path.exists(path):
+                            data, samplerate = load_audio(path)
+                            open_audio_stream(samplerate, data.shape[1])
+            add_debug(f"Preloaded {len(audio_cache)} TTS audio files")
+        except Exception as e:
+            add_debug(f"Audio preload error: {e}")
     
-    def play_tts_tu59():
-        def tts_thread():
-            try:
-                if not serial_port or not serial_port.is_open:
-                    add_debug("Serial port not available")
-                    status_var.set("Serial port error")
-                    return
-                
-                wav_file = "/tmp/tts_tu59.wav"
-                
-                # Check if pre-generated file exists
+    # Mode restore after TTS is deferred; while a restore is pending the rig is
+    # still in DATA mode and tts_original_mode holds the mode to return to
+    TTS_RESTORE_DELAY = 0.75
+    tts_original_mode = None
+    tts_restore_handle = None
+    tts_restore_epoch = 0
+    
+    def _wait_mode(target, timeout=0.25):
+        # Poll until the rig reports the new mode instead of sleeping a fixed
+        # settle time; most rigs switch well inside the timeout
+        t0 = time.monotonic()
+        while time.monotonic() - t0 < timeout:
+            if flrig.rig.get_mode() == target:
+                return True
+            time.sleep(0.01)
+        return False
+    
+    async def set_mode_async(mode, epoch):
+        if epoch != mode_epoch:
+            add_debug("Mode changed since TTS playback, skipping restore")
+            return
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, flrig.rig.set_mode, mode)
+            # Settle before the next queued press reads the mode back
+            await loop.run_in_executor(None, _wait_mode, mode)
+            add_debug(f"Restored to {mode} mode after TTS playback")
+        except Exception as e:
+            add_debug(f"Mode restore error: {e}")
+    
+    def restore_tts_mode_now():
+        # Runs on the async loop when the grace period ends
+        global tts_original_mode, tts_restore_handle
+        tts_restore_handle = None
+        if tts_original_mode is not None:
+            restore_mode = tts_original_mode.replace("-D", "")
+            tts_original_mode = None
+            epoch = tts_restore_epoch
+            tts_jobs.put_nowait(lambda: set_mode_async(restore_mode, epoch))
+    
+    async def play_tts(label, wav_file, pitch=None):
+        # Runs on async_loop: no Tk calls here, status goes through _set_status
+        global tts_original_mode, tts_restore_handle, tts_restore_epoch
+        loop = asyncio.get_running_loop()
+        
+        try:
+            if not serial_port or not serial_port.is_open:
+                add_debug("Serial port not available")
+                _set_status("Serial port error")
+                return
+            
+            # Check if pre-generated file exists
+            if not os.path.exists(wav_file):
+                add_debug("TTS file not ready yet, waiting...")
+                _set_status("Waiting for TTS generation...")
+                # Wait up to 5 seconds for pre-generation to finish
+                await loop.run_in_executor(None, tts_ready.wait, 5)
                 if not os.path.exists(wav_file):
-                    add_debug("TTS file not ready yet, waiting...")
-                    status_var.set("Waiting for TTS generation...")
-                    # Wait up to 5 seconds for file
-                    for i in range(50):
-                        if os.path.exists(wav_file):
-                            break
-                        time.sleep(0.1)
-                    if not os.path.exists(wav_file):
-                        add_debug("ERROR: TTS file still not available")
-                        status_var.set("TTS generation failed")
-                        return
-                
-                add_debug(f"Using pre-generated TTS audio: {wav_file}")
-                
-                # Save current mode and switch to DATA version of current mode
-                original_mode = None
-                try:
-                    original_mode = flrig.rig.get_mode()
+                    add_debug("ERROR: TTS file still not available")
+                    _set_status("TTS generation failed")
+                    return
+            
+            add_debug(f"Using pre-generated TTS audio: {wav_file}")
+            playback_file = wav_file
+            
+            # Use the pitch-shifted copy made at startup, if there is one
+            if pitch and pitch != "0":
+                pitched_file = pitched_file_path(wav_file, pitch)
+                if not os.path.exists(pitched_file) and not tts_ready.is_set():
+                    await loop.run_in_executor(None, tts_ready.wait, 5)
+                if os.path.exists(pitched_file):
+                    playback_file = pitched_file
+                else:
+                    add_debug("Pitched TTS file not available, using original file")
+            
+            # Save current mode and switch to DATA version of current mode
+            original_mode = None
+            press_epoch = mode_epoch
+            try:
+                if tts_restore_handle is not None:
+                    tts_restore_handle.cancel()
+                    tts_restore_handle = None
+                    # Previous press left the rig in DATA mode; keep it, unless
+                    # the band/mode was changed since
+                    if tts_restore_epoch == mode_epoch:
+                        original_mode = tts_original_mode
+                    tts_original_mode = None
+                if original_mode is not None:
+                    add_debug(f"Still in DATA mode from previous TTS (original: {original_mode})")
+                else:
+                    original_mode = await loop.run_in_executor(None, flrig.rig.get_mode)
                     add_debug(f"Current mode: {original_mode}")
                     # Switch to DATA version of current mode (USB->USB-D, LSB->LSB-D, etc)
                     if "-D" not in original_mode:
                         data_mode = original_mode + "-D"
-                    else:
-                        data_mode = original_mode
-                    flrig.rig.set_mode(data_mode)
-                    add_debug(f"Switched to {data_mode} mode")
-                    time.sleep(0.2)
-                except Exception as e:
-                    add_debug(f"Mode switch error: {e}")
-                
+                        await loop.run_in_executor(None, flrig.rig.set_mode, data_mode)
+                        add_debug(f"Switched to {data_mode} mode")
+                        if not await loop.run_in_executor(None, _wait_mode, data_mode):
+                            add_debug(f"Rig did not report {data_mode} within 250 ms")
+            except Exception as e:
+                add_debug(f"Mode switch error: {e}")
+            
+            try:
                 add_debug("Raising RTS to key radio...")
                 
-                # Raise RTS to key the radio
-                try:
-                    serial_port.rts = True
+                # Key the radio for the duration of playback
+                with keyed():
                     add_debug("RTS raised for TTS playback")
-                except Exception as e:
-                    add_debug(f"RTS error: {e}")
-                    status_var.set("RTS control failed")
-                    return
-                
-                # Play the generated audio with paplay
-                add_debug(f"Playing: paplay {wav_file}")
-                paplay_process = subprocess.Popen(
-                    ["paplay", wav_file],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-                
-                paplay_output, paplay_error = paplay_process.communicate()
-                if paplay_process.returncode != 0:
-                    add_debug(f"paplay error: {paplay_error.decode()}")
-                
-                add_debug("TTS playback finished, lowering RTS...")
-                
-                # Lower RTS after audio finishes
-                try:
-                    serial_port.rts = False
-                    add_debug("RTS lowered after TTS playback")
-                except Exception as e:
-                    add_debug(f"RTS lower error: {e}")
-                
-                # Switch back to original mode (non-DATA version)
+                    
+                    played = False
+                    if sd is not None:
+                        # Stream the samples ourselves; write() blocks in PortAudio, so
+                        # run it on the executor
+                        add_debug(f"Playing: {playback_file}")
+                        try:
+                            await loop.run_in_executor(None, write_audio, playback_file)
+                            played = True
+                        except Exception as e:
+                            add_debug(f"Audio output error: {e}, falling back to paplay")
+                    if not played:
+                        # Play the generated audio with paplay
+                        add_debug(f"Playing: paplay {playback_file}")
+                        # close_fds=False lets subprocess use posix_spawn/vfork instead
+                        # of fork+exec; our own fds are non-inheritable anyway
+                        paplay_process = await asyncio.create_subprocess_exec(
+                            PAPLAY, playback_file,
+                            stdout=asyncio.subprocess.DEVNULL,
+                            stderr=asyncio.subprocess.PIPE,
+                            close_fds=False
+                        )
+                        
+                        # stderr is only read on failure; on success it is empty
+                        if await paplay_process.wait() != 0:
+                            paplay_error = await paplay_process.stderr.read()
+                            add_debug(f"paplay error: {paplay_error.decode()}")
+                    
+                    add_debug("TTS playback finished, lowering RTS...")
+                add_debug("RTS lowered after TTS playback")
+            finally:
+                # Switch back to original mode (non-DATA version) after a short grace
+                # period, so a follow-up press can reuse the DATA mode
                 if original_mode:
-                    try:
-                        restore_mode = original_mode.replace("-D", "")
-                        flrig.rig.set_mode(restore_mode)
-                        add_debug(f"Restored to {restore_mode} mode after TTS playback")
-                        time.sleep(0.1)
-                    except Exception as e:
-                        add_debug(f"Mode restore error: {e}")
-                
-                status_var.set("TTS TU 59 finished")
-            except Exception as e:
-                add_debug(f"TTS error: {e}")
-                status_var.set(f"TTS error: {e}")
-                try:
-                    serial_port.rts = False
-                except:
-                    pass
-        
-        status_var.set("Playing TTS TU 59...")
-        tts_thread_obj = threading.Thread(target=tts_thread, daemon=True)
-        tts_thread_obj.start()
+                    tts_original_mode = original_mode
+                    tts_restore_epoch = press_epoch
+                    tts_restore_handle = loop.call_later(TTS_RESTORE_DELAY, restore_tts_mode_now)
+            
+            _set_status(f"TTS {label} finished")
+        except Exception as e:
+            add_debug(f"TTS error: {e}")
+            _set_status(f"TTS error: {e}")
     
-    btn_tts_tu59 = tk.Button(voice_row2, text=config.get('Piper TTS', 'button2_label', fallback='TU 59'), width=6, command=play_tts_tu59)
-    btn_tts_tu59.pack(side=tk.LEFT, padx=5)
+    # All TTS work (playback and deferred mode restores) goes through one queue
+    # drained by a single worker task, so presses never overlap on RTS or mode
+    tts_jobs = None
+    tts_worker_task = None
     
-    def play_tts_73():
-        def tts_thread():
+    async def tts_worker():
+        while True:
+            job = await tts_jobs.get()
             try:
-                if not serial_port or not serial_port.is_open:
-                    add_debug("Serial port not available")
-                    status_var.set("Serial port error")
-                    return
-                
-                wav_file = "/tmp/tts_73.wav"
-                pitched_file = "/tmp/tts_73_pitched.wav"
-                
-                # Check if pre-generated file exists
-                if not os.path.exists(wav_file):
-                    add_debug("TTS file not ready yet, waiting...")
-                    status_var.set("Waiting for TTS generation...")
-                    # Wait up to 5 seconds for file
-                    for i in range(50):
-                        if os.path.exists(wav_file):
-                            break
-                        time.sleep(0.1)
-                    if not os.path.exists(wav_file):
-                        add_debug("ERROR: TTS file still not available")
-                        status_var.set("TTS generation failed")
-                        return
-                
-                add_debug(f"Using pre-generated TTS audio: {wav_file}")
-                
-                # Apply sox pitch shift if configured
-                button3_pitch = config.get('Piper TTS', 'button3_pitch', fallback='150')
-                try:
-                    if button3_pitch and button3_pitch != "0":
-                        sox_cmd = ["sox", wav_file, pitched_file, "pitch", button3_pitch]
-                        result = subprocess.run(sox_cmd, capture_output=True, text=True)
-                        if result.returncode == 0:
-                            add_debug(f"Applied pitch shift ({button3_pitch} cents) to {pitched_file}")
-                            playback_file = pitched_file
-                        else:
-                            add_debug(f"Sox pitch error: {result.stderr}, using original file")
-                            playback_file = wav_file
-                    else:
-                        playback_file = wav_file
-                except Exception as e:
-                    add_debug(f"Sox error: {e}, using original file")
-                    playback_file = wav_file
-                
-                # Save current mode and switch to DATA version of current mode
-                original_mode = None
-                try:
-                    original_mode = flrig.rig.get_mode()
-                    add_debug(f"Current mode: {original_mode}")
-                    # Switch to DATA version of current mode (USB->USB-D, LSB->LSB-D, etc)
-                    if "-D" not in original_mode:
-                        data_mode = original_mode + "-D"
-                    else:
-                        data_mode = original_mode
-                    flrig.rig.set_mode(data_mode)
-                    add_debug(f"Switched to {data_mode} mode")
-                    time.sleep(0.2)
-                except Exception as e:
-                    add_debug(f"Mode switch error: {e}")
-                
-                add_debug("Raising RTS to key radio...")
-                
-                # Raise RTS to key the radio
-                try:
-                    serial_port.rts = True
-                    add_debug("RTS raised for TTS playback")
-                except Exception as e:
-                    add_debug(f"RTS error: {e}")
-                    status_var.set("RTS control failed")
-                    return
-                
-                # Play the generated audio with paplay
-                add_debug(f"Playing: paplay {playback_file}")
-                paplay_process = subprocess.Popen(
-                    ["paplay", playback_file],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-                
-                paplay_output, paplay_error = paplay_process.communicate()
-                if paplay_process.returncode != 0:
-                    add_debug(f"paplay error: {paplay_error.decode()}")
-                
-                add_debug("TTS playback finished, lowering RTS...")
-                
-                # Lower RTS after audio finishes
-                try:
-                    serial_port.rts = False
-                    add_debug("RTS lowered after TTS playback")
-                except Exception as e:
-                    add_debug(f"RTS lower error: {e}")
-                
-                # Switch back to original mode (non-DATA version)
-                if original_mode:
-                    try:
-                        restore_mode = original_mode.replace("-D", "")
-                        flrig.rig.set_mode(restore_mode)
-                        add_debug(f"Restored to {restore_mode} mode after TTS playback")
-                        time.sleep(0.1)
-                    except Exception as e:
-                        add_debug(f"Mode restore error: {e}")
-                
-                status_var.set("TTS 73 finished")
+                await job()
             except Exception as e:
-                add_debug(f"TTS error: {e}")
-                status_var.set(f"TTS error: {e}")
-                try:
-                    serial_port.rts = False
-                except:
-                    pass
-        
-        status_var.set("Playing TTS 73...")
-        tts_thread_obj = threading.Thread(target=tts_thread, daemon=True)
-        tts_thread_obj.start()
+                add_debug(f"TTS worker error: {e}")
+    
+    async def start_tts_worker():
+        global tts_jobs, tts_worker_task
+        tts_jobs = asyncio.Queue()  # created on the loop it belongs to
+        # Keep a reference: the loop only holds tasks weakly
+        tts_worker_task = asyncio.ensure_future(tts_worker())
+    
+    run_async(start_tts_worker(), timeout=5)
+    if sd is not None:
+        async_loop.call_soon_threadsafe(async_loop.run_in_executor, None, preload_tts_audio)
+    
+    def make_tts_button(label, wav_file, pitch=None):
+        def handler():
+            _set_status(f"Playing TTS {label}...")
+            async_loop.call_soon_threadsafe(tts_jobs.put_nowait, lambda: play_tts(label, wav_file, pitch))
+        btn = tk.Button(voice_row2, text=label, width=6, command=handler)
+        btn.pack(side=tk.LEFT, padx=5)
+        return btn
     
-    btn_tts_73 = tk.Button(voice_row2, text=config.get('Piper TTS', 'button3_label', fallback='73'), width=6, command=play_tts_73)
-    btn_tts_73.pack(side=tk.LEFT, padx=5)
+    btn_tts_n9oh = make_tts_button(CFG.button1_label, tts_files[1])
+    btn_tts_tu59 = make_tts_button(CFG.button2_label, tts_files[2])
+    btn_tts_73 = make_tts_button(CFG.button3_label, tts_files[3], CFG.button3_pitch)
 
     # Debug section (collapsible)
     debug_visible = False
@@ -1102,7 +1408,7 @@ try:
     debug_label.pack(fill=tk.X)
     
     debug_text = scrolledtext.ScrolledText(debug_frame, height=10, width=80, wrap=tk.WORD, 
-                                           bg="#f0f0f0", font=("Courier", 9))
+                                           bg="#f0f0f0", font=("Courier", 9), undo=False)
     debug_text.pack(fill=tk.X)
     
     # Clear debug button
@@ -1118,7 +1424,8 @@ try:
     add_debug("Rig Macros started")
 
     root.protocol("WM_DELETE_WINDOW", on_closing)
-    poll_rig_status()
+    threading.Thread(target=poll_rig_worker, daemon=True).start()
+    apply_rig_status()
     root.mainloop()
 
 except Exception as e: